@@ -31,9 +31,21 @@ Generates 10,000 samples with realistic feature correlations and noise.
 
 import numpy as np
 import pandas as pd
+import functools
+import hashlib
 import os
+import sys
 
-np.random.seed(42)
+# Optional: PyArrow's C++ CSV writer and the Parquet sibling output
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+SEED = 42
 
 NUM_SAMPLES = 10000
 NUM_FEATURES = 9
@@ -146,8 +158,27 @@ CAREER_ARCHETYPES = {
 # IT is most popular, followed by Govt, MBA, Higher Studies, MS Abroad, Startup
 CAREER_DISTRIBUTION = [0.28, 0.18, 0.18, 0.10, 0.14, 0.12]
 
+# Archetypes flattened to (career, feature) arrays in FEATURE_NAMES order so
+# sampling is a single broadcast instead of one RNG call per feature.
+# CAREER_ARCHETYPES stays the source of truth; the hot path only reads these.
+# float32 throughout: features live in [0, 1] and are rounded to 4 decimals.
+CAREER_MEANS = np.array(
+    [[CAREER_ARCHETYPES[c][f][0] for f in FEATURE_NAMES] for c in range(NUM_CAREERS)],
+    dtype=np.float32,
+)
+CAREER_STDS = np.array(
+    [[CAREER_ARCHETYPES[c][f][1] for f in FEATURE_NAMES] for c in range(NUM_CAREERS)],
+    dtype=np.float32,
+)
+CAREER_MEANS.setflags(write=False)
+CAREER_STDS.setflags(write=False)
+
+# career_instability gets two successive noisy updates (σ=0.08 scaled by the
+# second update's 0.6, then σ=0.05); they are fused into one Gaussian draw
+CAREER_INSTABILITY_NOISE = float(np.hypot(0.6 * 0.08, 0.05))
+
 
-def add_feature_correlations(features: np.ndarray) -> np.ndarray:
+def add_feature_correlations(features: np.ndarray, rng: np.random.Generator) -> np.ndarray:
     """
     Add realistic correlations between features:
     - High financial_pressure ↔ high income_urgency (r≈0.6)
@@ -156,27 +187,35 @@ def add_feature_correlations(features: np.ndarray) -> np.ndarray:
     - High govt_interest ↔ low risk_tolerance (r≈-0.5)
     - High abroad_interest ↔ low govt_interest (r≈-0.4)
     """
-    # financial_pressure → income_urgency correlation
-    features[:, 7] = 0.4 * features[:, 7] + 0.6 * features[:, 1] + np.random.normal(0, 0.08, len(features))
+    # All correlation noise drawn up front into one buffer (one row per update)
+    noise = rng.standard_normal((2, len(features)), dtype=np.float32)
+    noise *= np.array([[0.08], [CAREER_INSTABILITY_NOISE]], dtype=np.float32)
     
-    # academic_strength → career_instability (inverse)
-    features[:, 8] = 0.7 * features[:, 8] - 0.3 * features[:, 0] + np.random.normal(0, 0.08, len(features))
+    # financial_pressure → income_urgency correlation
+    noise[0] += 0.6 * features[:, 1]
+    features[:, 7] *= 0.4
+    features[:, 7] += noise[0]
     
-    # risk_tolerance → career_instability (positive)
-    features[:, 8] = 0.6 * features[:, 8] + 0.4 * features[:, 2] + np.random.normal(0, 0.05, len(features))
+    # academic_strength → career_instability (inverse), then
+    # risk_tolerance → career_instability (positive), composed into one update:
+    #   0.6 * (0.7x - 0.3a + ε₁) + 0.4r + ε₂ = 0.42x - 0.18a + 0.4r + ε
+    noise[1] -= 0.18 * features[:, 0]
+    noise[1] += 0.4 * features[:, 2]
+    features[:, 8] *= 0.42
+    features[:, 8] += noise[1]
     
     # govt_interest → risk_tolerance (inverse)
-    mask_govt = features[:, 5] > 0.6
-    features[mask_govt, 2] *= 0.6
+    factor = np.where(features[:, 5] > 0.6, np.float32(0.6), np.float32(1.0))
+    np.multiply(features[:, 2], factor, out=features[:, 2])
     
     # abroad_interest → govt_interest (inverse)
-    mask_abroad = features[:, 6] > 0.7
-    features[mask_abroad, 5] *= 0.3
+    factor = np.where(features[:, 6] > 0.7, np.float32(0.3), np.float32(1.0))
+    np.multiply(features[:, 5], factor, out=features[:, 5])
     
     return features
 
 
-def add_noise_and_boundary_cases(features: np.ndarray, labels: np.ndarray) -> tuple:
+def add_noise_and_boundary_cases(features: np.ndarray, labels: np.ndarray, rng: np.random.Generator) -> tuple:
     """
     Add realistic noise:
     - 5% of samples get random feature perturbation (real students are messy)
@@ -186,75 +225,155 @@ def add_noise_and_boundary_cases(features: np.ndarray, labels: np.ndarray) -> tu
     n = len(features)
     
     # Random feature perturbation
-    noise_mask = np.random.random(n) < 0.05
-    noise_amount = np.random.normal(0, 0.15, (noise_mask.sum(), NUM_FEATURES))
+    noise_mask = rng.random(n) < 0.05
+    noise_amount = rng.normal(0, 0.15, (noise_mask.sum(), NUM_FEATURES)).astype(np.float32, copy=False)
     features[noise_mask] += noise_amount
     
     # Confused labels (3% label noise — simulates students who change career paths)
-    confused_mask = np.random.random(n) < 0.03
-    labels[confused_mask] = np.random.randint(0, NUM_CAREERS, confused_mask.sum())
+    confused_mask = rng.random(n, dtype=np.float32) < 0.03
+    labels = np.where(confused_mask, rng.integers(0, NUM_CAREERS, n, dtype=np.int8), labels)
     
     # Add boundary cases: 2% of samples with mixed high features
-    boundary_mask = np.random.random(n) < 0.02
-    for idx in np.where(boundary_mask)[0]:
-        # Student with 2-3 high features from different careers
-        high_features = np.random.choice(NUM_FEATURES, size=np.random.randint(2, 4), replace=False)
-        features[idx, high_features] = np.random.uniform(0.7, 0.95, len(high_features))
-    
-    return features, labels
-
-
-def generate_career_samples(career_id: int, n_samples: int) -> tuple:
-    """Generate n_samples for a specific career archetype."""
-    archetype = CAREER_ARCHETYPES[career_id]
-    features = np.zeros((n_samples, NUM_FEATURES))
-    
-    for i, fname in enumerate(FEATURE_NAMES):
-        mean, std = archetype[fname]
-        features[:, i] = np.random.normal(mean, std, n_samples)
+    boundary_mask = rng.random(n) < 0.02
+    rows = np.where(boundary_mask)[0][:, None]
+    # Student with 2-3 high features from different careers: shuffle each
+    # row's feature indices, take the first 3 and keep only the first k
+    cols = rng.permuted(np.tile(np.arange(NUM_FEATURES), (len(rows), 1)), axis=1)[:, :3]
+    k = rng.integers(2, 4, size=len(rows))
+    vals = rng.uniform(0.7, 0.95, size=(len(rows), 3)).astype(np.float32)
+    features[rows, cols] = np.where(np.arange(3) < k[:, None], vals, features[rows, cols])
     
-    labels = np.full(n_samples, career_id)
     return features, labels
 
 
-def generate_full_dataset() -> pd.DataFrame:
-    """Generate the complete training dataset."""
-    all_features = []
-    all_labels = []
+@functools.lru_cache(maxsize=1)
+def _generate_arrays(seed: int) -> tuple:
+    """
+    Generate the (features, labels) arrays behind generate_full_dataset.
     
-    # Generate samples per career based on distribution
-    for career_id in range(NUM_CAREERS):
-        n = int(NUM_SAMPLES * CAREER_DISTRIBUTION[career_id])
-        features, labels = generate_career_samples(career_id, n)
-        all_features.append(features)
-        all_labels.append(labels)
+    Deterministic for a given seed, so the result is cached; both arrays
+    are returned read-only so the cached copy can't be mutated.
+    """
+    rng = np.random.default_rng(seed)
     
-    features = np.vstack(all_features)
-    labels = np.concatenate(all_labels)
+    # Samples per career based on distribution, drawn in one shot into the
+    # final buffer: each row is scaled/shifted in place by its career's (std, mean)
+    counts = (NUM_SAMPLES * np.array(CAREER_DISTRIBUTION)).astype(int)
+    labels = np.repeat(np.arange(NUM_CAREERS, dtype=np.int8), counts)
+    features = rng.standard_normal((labels.size, NUM_FEATURES), dtype=np.float32)
+    features *= CAREER_STDS[labels]
+    features += CAREER_MEANS[labels]
     
     # Add correlations
-    features = add_feature_correlations(features)
+    features = add_feature_correlations(features, rng)
     
     # Add noise and boundary cases
-    features, labels = add_noise_and_boundary_cases(features, labels)
+    features, labels = add_noise_and_boundary_cases(features, labels, rng)
+    
+    # Clamp to [0, 1] (in place)
+    np.clip(features, 0.0, 1.0, out=features)
     
-    # Clamp to [0, 1]
-    features = np.clip(features, 0.0, 1.0)
+    # Round to 4 decimal places (in place)
+    features *= 10000
+    np.rint(features, out=features)
+    features /= 10000
     
-    # Round to 4 decimal places
-    features = np.round(features, 4)
+    # Shuffle rows with one permutation gather, before pandas is involved
+    perm = rng.permutation(len(labels))
+    features = features[perm]
+    labels = labels[perm]
     
-    # Build DataFrame
-    df = pd.DataFrame(features, columns=FEATURE_NAMES)
-    df["career_label"] = labels.astype(int)
-    df["career_name"] = df["career_label"].map(lambda x: CAREER_LABELS[x])
+    # Column-major, so each feature column is contiguous for the DataFrame
+    features = np.asfortranarray(features)
+    features.setflags(write=False)
+    labels.setflags(write=False)
     
-    # Shuffle
-    df = df.sample(frac=1, random_state=42).reset_index(drop=True)
+    return features, labels
+
+
+def generate_full_dataset(seed: int = SEED) -> pd.DataFrame:
+    """
+    Generate the complete training dataset.
+    
+    The arrays are cached per seed; every call builds a fresh DataFrame
+    from them, so callers are free to mutate the result.
+    """
+    features, labels = _generate_arrays(seed)
+    
+    # Build DataFrame from contiguous columns: each one is copied as its own
+    # block instead of transposing the row-major matrix
+    df = pd.DataFrame({name: features[:, i] for i, name in enumerate(FEATURE_NAMES)}, copy=True)
+    career = pd.Categorical.from_codes(labels.copy(), categories=CAREER_LABELS)
+    df["career_label"] = career.codes
+    df["career_name"] = career
     
     return df
 
 
+def dataset_fingerprint() -> str:
+    """
+    Hash of the generation parameters and of this module's source, so edits
+    to the correlation, noise, boundary or rounding code also invalidate it.
+    """
+    h = hashlib.sha256(repr((SEED, NUM_SAMPLES, CAREER_DISTRIBUTION)).encode())
+    h.update(CAREER_MEANS.tobytes())
+    h.update(CAREER_STDS.tobytes())
+    with open(os.path.abspath(__file__), "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+def fingerprint_path(output_path: str) -> str:
+    """Sidecar file recording which parameters produced output_path."""
+    return os.path.splitext(output_path)[0] + ".fingerprint"
+
+
+def save_dataset(df: pd.DataFrame, output_path: str):
+    """
+    Write the dataset as CSV, through PyArrow when available. With PyArrow a
+    Parquet copy (binary float32 columns, dictionary-encoded career_name) is
+    written next to it for faster loading by the trainer (which only reads
+    it); its path is returned (None otherwise). The parameter fingerprint is
+    recorded last, so an interrupted write is never mistaken for an
+    up-to-date dataset.
+    """
+    parquet_path = None
+    if HAS_PYARROW:
+        # One Arrow table feeds both writers
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pacsv.write_csv(table, output_path)
+        parquet_path = os.path.splitext(output_path)[0] + ".parquet"
+        pq.write_table(table, parquet_path, compression="snappy")
+    else:
+        df.to_csv(output_path, index=False)
+    
+    with open(fingerprint_path(output_path), "w") as f:
+        f.write(dataset_fingerprint() + "\n")
+    return parquet_path
+
+
+def is_up_to_date(output_path: str) -> bool:
+    """
+    True if output_path was generated by the current parameters and code
+    (per its fingerprint sidecar) and, with PyArrow, its Parquet copy is
+    present and no older than the CSV. File mtimes alone can't tell: after a fresh
+    clone they only reflect checkout order.
+    """
+    fp_path = fingerprint_path(output_path)
+    if not (os.path.exists(output_path) and os.path.exists(fp_path)):
+        return False
+    with open(fp_path) as f:
+        if f.read().strip() != dataset_fingerprint():
+            return False
+    if HAS_PYARROW:
+        parquet_path = os.path.splitext(output_path)[0] + ".parquet"
+        return (
+            os.path.exists(parquet_path)
+            and os.path.getmtime(parquet_path) >= os.path.getmtime(output_path)
+        )
+    return True
+
+
 def print_summary(df: pd.DataFrame):
     """Print dataset summary statistics."""
     print("=" * 70)
@@ -276,22 +395,27 @@ def print_summary(df: pd.DataFrame):
               f"min={df[col].min():.3f}  max={df[col].max():.3f}")
     
     print("\n--- Feature Correlations (top) ---")
-    corr = df[FEATURE_NAMES].corr()
-    pairs = []
-    for i in range(len(FEATURE_NAMES)):
-        for j in range(i + 1, len(FEATURE_NAMES)):
-            pairs.append((FEATURE_NAMES[i], FEATURE_NAMES[j], abs(corr.iloc[i, j])))
-    pairs.sort(key=lambda x: x[2], reverse=True)
-    for f1, f2, c in pairs[:8]:
-        sign = "+" if corr.loc[f1, f2] > 0 else "-"
-        print(f"  {f1:25s} ↔ {f2:25s}: {sign}{c:.3f}")
+    corr = np.corrcoef(df[FEATURE_NAMES].to_numpy(), rowvar=False)
+    iu, ju = np.triu_indices(NUM_FEATURES, k=1)
+    vals = corr[iu, ju]
+    for k in np.argsort(-np.abs(vals), kind="stable")[:8]:
+        sign = "+" if vals[k] > 0 else "-"
+        print(f"  {FEATURE_NAMES[iu[k]]:25s} ↔ {FEATURE_NAMES[ju[k]]:25s}: {sign}{abs(vals[k]):.3f}")
 
 
 if __name__ == "__main__":
-    df = generate_full_dataset()
-    
     output_path = os.path.join(os.path.dirname(__file__), "career_training_data.csv")
-    df.to_csv(output_path, index=False)
-    print(f"\n✅ Dataset saved to: {output_path}")
+    
+    # Skip regeneration when the dataset on disk matches the current parameters
+    if "--force" not in sys.argv and is_up_to_date(output_path):
+        print(f"\n✅ Dataset up to date, skipping generation: {output_path}")
+        print("   (pass --force to regenerate)")
+        df = pd.read_csv(output_path)
+    else:
+        df = generate_full_dataset()
+        parquet_path = save_dataset(df, output_path)
+        print(f"\n✅ Dataset saved to: {output_path}")
+        if parquet_path:
+            print(f"✅ Parquet copy saved to: {parquet_path}")
     
     print_summary(df)